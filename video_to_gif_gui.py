@@ -42,27 +42,42 @@ Run:
   python video_to_gif_gui.py
 
 Example ffmpeg snippets (used in this script)
-- Palette (best quality):
-  ffmpeg -ss {START} -to {END} -i "{INPUT}" -vf "fps={FPS},scale={WIDTH}:-1:flags=lanczos,palettegen" -y "{PALETTE}"
-  ffmpeg -ss {START} -to {END} -i "{INPUT}" -i "{PALETTE}" -lavfi "fps={FPS},scale={WIDTH}:-1:flags=lanczos [x]; [x][1:v] paletteuse" -y "{OUTPUT}"
+- Palette (best quality, one pass; palette never touches disk):
+  ffmpeg -ss {START} -t {DURATION} -i "{INPUT}" -filter_complex "fps={FPS},scale={WIDTH}:-1:flags=lanczos,split[a][b];[a]palettegen[p];[b][p]paletteuse" -y "{OUTPUT}"
+  ({START} is an input option for fast keyframe seek and {DURATION} = END - START
+  limits the input, so palettegen sees EOF at the end of the range. Commands
+  without palettegen use -t as an output option instead.)
+  When split would buffer more than ~256 MB of frames, the palette is written
+  to a temporary palette.png first and applied in a second paletteuse pass.
+  Clips longer than 30 s on machines with 4+ cores generate per-segment palettes
+  in parallel, merge them with hstack + palettegen=stats_mode=single, then run
+  a single paletteuse pass with the merged palette as a second input.
 - Single-step (faster, lower quality):
-  ffmpeg -ss {START} -to {END} -i "{INPUT}" -vf "fps={FPS},scale={WIDTH}:-1:flags=lanczos" -y "{OUTPUT}"
+  ffmpeg -ss {START} -i "{INPUT}" -t {DURATION} -vf "fps={FPS},scale={WIDTH}:-1:flags=lanczos" -y "{OUTPUT}"
 
 Notes
 -----
- - This script uses subprocess.run with check=True and captures stdout/stderr for error reporting.
+ - GIF exports run ffmpeg with "-progress pipe:1" and report percentages to the status log;
+   only error-level ffmpeg output is kept for error reporting.
  - If Pillow is not installed, preview feature will be disabled (the rest of the functionality still works).
+ - Only the parallel palette path for long clips writes temporary files; they are removed after export.
  - The GUI uses threading to run ffmpeg operations so the UI remains responsive.
 """
 
 from __future__ import annotations
+import io
 import os
+import re
 import sys
+import json
+import shutil
+import concurrent.futures
 import subprocess
 import tempfile
 import threading
 import shlex
 import math
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Optional, Tuple
 
@@ -80,14 +95,77 @@ try:
 except Exception:
     PIL_AVAILABLE = False
 
-# Prefer bundled ffmpeg/ffprobe when present (next to executable or in ffmpeg_binaries/<platform>/)
+# None until known; True once bundled binaries are found or ffmpeg -version succeeds
+_FFMPEG_OK: Optional[bool] = None
+
+def _mark_ffmpeg_ok():
+    global _FFMPEG_OK
+    _FFMPEG_OK = True
+
+# Bundled binary locations found by a previous run, keyed on sys.executable (and
+# its mtime) plus this script's path
+BINS_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "video_to_gif", "bins.json")
+
+def _executable_mtime() -> Optional[int]:
+    try:
+        return os.stat(sys.executable).st_mtime_ns
+    except (OSError, TypeError):
+        return None
+
+def _load_cached_binaries() -> Optional[tuple[str, str]]:
+    """Return cached (ffmpeg, ffprobe) if they belong to this executable and are still executable."""
+    try:
+        with open(BINS_CACHE_PATH, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if (data.get("executable") == sys.executable and data.get("exe_mtime") == _executable_mtime()
+                and data.get("source") == os.path.abspath(__file__)
+                and all(os.path.isfile(data[k]) and os.access(data[k], os.X_OK) for k in ("ffmpeg", "ffprobe"))):
+            return data["ffmpeg"], data["ffprobe"]
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        pass
+    return None
+
+def _save_cached_binaries(ffmpeg_cmd: str, ffprobe_cmd: str):
+    data = {"executable": sys.executable, "exe_mtime": _executable_mtime(),
+            "source": os.path.abspath(__file__), "ffmpeg": ffmpeg_cmd, "ffprobe": ffprobe_cmd}
+    try:
+        os.makedirs(os.path.dirname(BINS_CACHE_PATH), exist_ok=True)
+        with open(BINS_CACHE_PATH, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+    except OSError:
+        pass
+
 def find_ffmpeg_binaries() -> tuple[str, str]:
     """Return (ffmpeg_cmd, ffprobe_cmd).
 
+    Bundled binaries found by a previous run are reused from BINS_CACHE_PATH
+    after checking both are still executable files, skipping the candidate scan (see
+    _scan_ffmpeg_binaries for the search order). A bundled hit has already
+    been verified as executable, so it also marks ffmpeg as available and
+    check_ffmpeg_available will not spawn it.
+    """
+    cached = _load_cached_binaries()
+    if cached:
+        _mark_ffmpeg_ok()
+        return cached
+    ffmpeg_cmd, ffprobe_cmd, bundled = _scan_ffmpeg_binaries()
+    if bundled:
+        _mark_ffmpeg_ok()
+        # a onefile build extracts to a new sys._MEIPASS each run, so such a
+        # hit could never be reused; don't rewrite the cache on every launch
+        meipass = getattr(sys, "_MEIPASS", None)
+        if not (meipass and os.path.abspath(ffmpeg_cmd).startswith(os.path.abspath(meipass) + os.sep)):
+            _save_cached_binaries(ffmpeg_cmd, ffprobe_cmd)
+    return ffmpeg_cmd, ffprobe_cmd
+
+# Prefer bundled ffmpeg/ffprobe when present (next to executable or in ffmpeg_binaries/<platform>/)
+def _scan_ffmpeg_binaries() -> tuple[str, str, bool]:
+    """Return (ffmpeg_cmd, ffprobe_cmd, bundled).
+
     Preference order:
     1. If running frozen (PyInstaller), look next to the executable for ffmpeg/ffprobe.
     2. Look in "ffmpeg_binaries/<platform>/" under the script directory for named binaries.
-    3. Fall back to system commands "ffmpeg" and "ffprobe".
+    3. Fall back to system commands "ffmpeg" and "ffprobe" (bundled is False).
     """
     exe_dir = None
     try:
@@ -110,7 +188,7 @@ def find_ffmpeg_binaries() -> tuple[str, str]:
     ff_local = os.path.join(exe_dir, ffmpeg_name)
     fp_local = os.path.join(exe_dir, ffprobe_name)
     if os.path.isfile(ff_local) and os.access(ff_local, os.X_OK) and os.path.isfile(fp_local) and os.access(fp_local, os.X_OK):
-        return ff_local, fp_local
+        return ff_local, fp_local, True
 
     # 2) check ffmpeg_binaries/<platform>/ in several likely locations. When
     # frozen, PyInstaller may place data in Resources or Frameworks inside the
@@ -133,7 +211,8 @@ def find_ffmpeg_binaries() -> tuple[str, str]:
     candidates.append(os.path.join(app_root, "Resources", "ffmpeg_binaries"))
     candidates.append(os.path.join(app_root, "Frameworks", "ffmpeg_binaries"))
     # PyInstaller --onedir sometimes extracts internal data under an _internal dir
-    candidates.append(os.path.join(os.path.dirname(parent), "_internal", "ffmpeg_binaries"))
+    candidates.append(os.path.join(app_contents, "_internal", "ffmpeg_binaries"))
+    candidates.append(os.path.join(exe_dir, "_internal", "ffmpeg_binaries"))
     # sys._MEIPASS if onefile
     meipass = getattr(sys, "_MEIPASS", None)
     if meipass:
@@ -150,29 +229,40 @@ def find_ffmpeg_binaries() -> tuple[str, str]:
         ff_local = os.path.join(platform_dir, ffmpeg_name)
         fp_local = os.path.join(platform_dir, ffprobe_name)
         if os.path.isfile(ff_local) and os.access(ff_local, os.X_OK) and os.path.isfile(fp_local) and os.access(fp_local, os.X_OK):
-            return ff_local, fp_local
+            return ff_local, fp_local, True
 
     # Fallback to system commands
-    return ffmpeg_name, ffprobe_name
+    return ffmpeg_name, ffprobe_name, False
 
 # Expose chosen commands
 FFMPEG_CMD, FFPROBE_CMD = find_ffmpeg_binaries()
 
 
 def check_ffmpeg_available() -> bool:
-    """Return True if ffmpeg (and ffprobe) appear available on PATH or bundled."""
-    for cmd in ((FFMPEG_CMD, "-version"), (FFPROBE_CMD, "-version")):
-        try:
-            subprocess.run([cmd[0], cmd[1]], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
-        except Exception:
-            return False
-    return True
+    """
+    Return True if ffmpeg appears available (bundled or on PATH).
+
+    Only ffmpeg is required: probe_video falls back to ffmpeg when ffprobe is
+    missing. The result is cached, so at most one "ffmpeg -version" is spawned
+    per process, and none when bundled binaries were found.
+    """
+    global _FFMPEG_OK
+    if _FFMPEG_OK is None:
+        _FFMPEG_OK = run_quiet([FFMPEG_CMD, "-version"]) == 0
+    return _FFMPEG_OK
+
+def run_quiet(cmd: list[str]) -> int:
+    """Run subprocess command with all output discarded and return its returncode."""
+    try:
+        return subprocess.run(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                              stderr=subprocess.DEVNULL, check=False).returncode
+    except Exception:
+        return 1
 
-def run_subprocess(cmd: list[str], capture: bool = True) -> Tuple[int, str, str]:
+def run_captured(cmd: list[str]) -> Tuple[int, str, str]:
     """Run subprocess command and return (returncode, stdout, stderr)."""
     try:
-        proc = subprocess.run(cmd, stdout=subprocess.PIPE if capture else None,
-                              stderr=subprocess.PIPE if capture else None,
+        proc = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
                               text=True, check=False)
         stdout = proc.stdout or ""
         stderr = proc.stderr or ""
@@ -180,6 +270,50 @@ def run_subprocess(cmd: list[str], capture: bool = True) -> Tuple[int, str, str]
     except Exception as e:
         return 1, "", str(e)
 
+def stream_ffmpeg(cmd: list[str], duration: Optional[float], progress_cb=None,
+                  report_step: int = 10, proc_callback=None) -> Tuple[int, str]:
+    """
+    Run an ffmpeg command with machine-readable progress on stdout.
+
+    Adds "-progress pipe:1 -nostats -loglevel error" so ffmpeg only emits
+    key=value progress lines plus actual errors (merged from stderr). Progress
+    is parsed line by line instead of buffering the full log; progress_cb is
+    called with an int percentage every report_step percent when duration is
+    known. proc_callback, if given, receives the Popen right after it starts
+    (used by the GUI to cancel exports). Returns (returncode, error_text).
+    """
+    cmd = [cmd[0], "-progress", "pipe:1", "-nostats", "-loglevel", "error"] + cmd[1:]
+    errors: list[str] = []
+    last_reported = -1
+    try:
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                stdin=subprocess.DEVNULL, text=True, errors="replace")
+    except Exception as e:
+        return 1, str(e)
+    if proc_callback:
+        proc_callback(proc)
+    for line in proc.stdout:
+        key, sep, value = line.strip().partition("=")
+        if not sep or not key.replace("_", "").isalnum():
+            if line.strip():
+                errors.append(line.rstrip())
+            continue
+        # out_time_ms is (despite its name) in microseconds, same as out_time_us
+        if key in ("out_time_us", "out_time_ms") and duration and progress_cb:
+            try:
+                pct = min(100, int(int(value) / 1e6 / duration * 100))
+            except ValueError:
+                continue
+            pct -= pct % report_step
+            if pct > last_reported:
+                last_reported = pct
+                progress_cb(pct)
+    rc = proc.wait()
+    return rc, "\n".join(errors[-10:])
+
+# [[HH:]MM:]SS[.fff] -- plain seconds, MM:SS or HH:MM:SS
+_TIME_RE = re.compile(r"^\s*(?:(?:(\d+):)?(\d+):)?(\d+(?:\.\d*)?|\.\d+)\s*$")
+
 def parse_time(t: str) -> Optional[float]:
     """
     Parse a time string in seconds or HH:MM:SS(.ms) format to seconds (float).
@@ -187,32 +321,18 @@ def parse_time(t: str) -> Optional[float]:
     """
     if t is None:
         return None
-    t = str(t).strip()
-    if t == "":
+    m = _TIME_RE.match(str(t))
+    if not m:
         return None
-    # Try plain float seconds
-    try:
-        return float(t)
-    except ValueError:
-        pass
-    parts = t.split(":")
-    try:
-        parts = [float(p) for p in parts]
-    except ValueError:
-        return None
-    if len(parts) == 1:
-        return parts[0]
-    # hh:mm:ss or mm:ss
-    parts = list(reversed(parts))
-    seconds = 0.0
-    multiplier = 1.0
-    for p in parts:
-        seconds += p * multiplier
-        multiplier *= 60.0
-    return seconds
+    h, mn, s = m.groups(default="0")
+    return int(h) * 3600 + int(mn) * 60 + float(s)
 
 def format_time_seconds(s: float) -> str:
-    """Format seconds as HH:MM:SS.mmm (no timezone)."""
+    """Format seconds as HH:MM:SS.mmm (no timezone) for display.
+
+    ffmpeg arguments are passed as plain float seconds instead, which avoids
+    the millisecond truncation done here.
+    """
     if s is None:
         return "Unknown"
     ms = int((s - math.floor(s)) * 1000)
@@ -223,111 +343,452 @@ def format_time_seconds(s: float) -> str:
     hour = total // 60
     return f"{hour:02d}:{minute:02d}:{sec:02d}.{ms:03d}"
 
-def get_video_duration(path: str) -> Optional[float]:
-    """Get video duration in seconds using ffprobe, fallback to ffmpeg -i stderr parsing."""
-    # Try ffprobe
+@dataclass(frozen=True)
+class VideoInfo:
+    duration: Optional[float] = None
+    width: Optional[int] = None
+    height: Optional[int] = None
+    fps: Optional[float] = None  # from the first video stream's avg_frame_rate
+
+def _parse_frame_rate(rate: Optional[str]) -> Optional[float]:
+    """Parse an ffprobe rate such as '30000/1001' to a float; None if unknown."""
+    if not rate:
+        return None
     try:
-        cmd = ["ffprobe", "-v", "error", "-show_entries", "format=duration",
-               "-of", "default=noprint_wrappers=1:nokey=1", path]
-        rc, out, err = run_subprocess(cmd)
-        if rc == 0 and out.strip():
-            return float(out.strip())
-    except Exception:
-        pass
-    # Fallback: ffmpeg -i outputs duration to stderr
+        num, _, den = rate.partition("/")
+        value = float(num) / float(den or 1)
+    except (ValueError, ZeroDivisionError):
+        return None
+    return value if value > 0 else None
+
+def _probe_with_ffmpeg(path: str) -> VideoInfo:
+    """Fallback when ffprobe is missing: parse what ffmpeg -i prints to stderr."""
+    rc, out, err = run_captured([FFMPEG_CMD, "-i", path])
+    text = out + err
+    duration = width = height = fps = None
+    m = re.search(r"Duration: (\d+):(\d+):([\d\.]+)", text)
+    if m:
+        h, m_, s = m.groups()
+        duration = float(h) * 3600.0 + float(m_) * 60.0 + float(s)
+    # e.g. "Stream #0:0(und): Video: h264 (avc1 / 0x31637661), yuv420p, 1280x720 [SAR 1:1], 30 fps, ..."
+    video = re.search(r"Stream #.*?Video:(.*)", text)
+    if video:
+        size = re.search(r"\b(\d{2,})x(\d{2,})\b", video.group(1))
+        if size:
+            width, height = int(size.group(1)), int(size.group(2))
+        rate = re.search(r"([\d.]+) fps", video.group(1))
+        if rate:
+            fps = _parse_frame_rate(rate.group(1))
+    return VideoInfo(duration=duration, width=width, height=height, fps=fps)
+
+def _probe_with_ffprobe(path: str) -> VideoInfo:
+    cmd = [FFPROBE_CMD, "-v", "error", "-print_format", "json",
+           "-show_format", "-show_streams", path]
+    rc, out, err = run_captured(cmd)
+    if rc != 0 or not out.strip():
+        return VideoInfo()
     try:
-        cmd = ["ffmpeg", "-i", path]
-        rc, out, err = run_subprocess(cmd)
-        text = out + err
-        # search 'Duration: HH:MM:SS.xx'
-        import re
-        m = re.search(r"Duration: (\d+):(\d+):([\d\.]+)", text)
-        if m:
-            h, m_, s = m.groups()
-            return float(h) * 3600.0 + float(m_) * 60.0 + float(s)
-    except Exception:
-        pass
-    return None
+        data = json.loads(out)
+    except ValueError:
+        return VideoInfo()
+    try:
+        duration = float(data.get("format", {}).get("duration"))
+    except (TypeError, ValueError):
+        duration = None
+    for stream in data.get("streams", []):
+        if stream.get("codec_type") == "video":
+            return VideoInfo(duration=duration, width=stream.get("width"), height=stream.get("height"),
+                             fps=_parse_frame_rate(stream.get("avg_frame_rate")))
+    return VideoInfo(duration=duration)
+
+_PROBE_CACHE_SIZE = 32
+# (path, st_mtime_ns, st_size) -> VideoInfo, least recently used first; failures are not stored
+_probe_cache: OrderedDict[Tuple[str, int, int], VideoInfo] = OrderedDict()
+
+def probe_video(path: str) -> VideoInfo:
+    """
+    Return duration and first video stream geometry/frame rate using a single
+    ffprobe call (or ffmpeg -i when ffprobe is missing). Successful results are
+    memoized by (path, mtime, size) so re-opening an unchanged file does not
+    spawn ffprobe again; an empty result is retried on the next call.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return VideoInfo()
+    key = (path, st.st_mtime_ns, st.st_size)
+    info = _probe_cache.get(key)
+    if info is not None:
+        _probe_cache.move_to_end(key)
+        return info
+    if shutil.which(FFPROBE_CMD) is None:
+        info = _probe_with_ffmpeg(path)
+    else:
+        info = _probe_with_ffprobe(path)
+    if info != VideoInfo():
+        _probe_cache[key] = info
+        if len(_probe_cache) > _PROBE_CACHE_SIZE:
+            _probe_cache.popitem(last=False)
+    return info
+
+def get_video_duration(path: str) -> Optional[float]:
+    """Get video duration in seconds (see probe_video)."""
+    return probe_video(path).duration
 
 @dataclass
 class ExportOptions:
     fps: int = 10
     width: Optional[int] = None  # None means keep original width
     method: str = "palette"  # 'palette' or 'single'
+    max_colors: int = 256  # palettegen colour budget (palette method)
+    stats_mode: str = "full"  # palettegen stats_mode: 'full' or 'diff' (moving regions)
+    dither: str = "sierra2_4a"  # paletteuse dither, e.g. 'bayer:bayer_scale=5' (cheaper)
+
+# "Fast palette" preset: smaller palette and ordered dithering
+FAST_PALETTE = dict(max_colors=128, stats_mode="diff", dither="bayer:bayer_scale=5")
 
 # FFmpeg operations
 
-def run_ffmpeg_palette(input_path: str, start: float, end: float, fps: int, width: Optional[int], output_path: str,
-                       work_dir: str, progress_callback=None) -> Tuple[bool, str]:
+# Output options for every GIF export: force the gif muxer (the output name may
+# lack a .gif extension), loop forever, and let ffmpeg pick the thread count
+GIF_OUTPUT_ARGS = ["-threads", "0", "-loop", "0", "-f", "gif"]
+
+def _scale_filter(width: Optional[int]) -> str:
+    """Scale filter for the GIF width; bilinear is plenty for small outputs."""
+    if not width:
+        return "scale=iw:-1:flags=lanczos"
+    flags = "bilinear" if width <= 360 else "lanczos"
+    return f"scale={width}:-1:flags={flags}"
+
+def _progress_logger(progress_callback):
+    """Adapt a message callback to the percentage callback of stream_ffmpeg."""
+    if not progress_callback:
+        return None
+    return lambda pct: progress_callback(f"Progress: {pct}%")
+
+# Clips longer than this get their palette generated in parallel segments
+PARALLEL_PALETTE_MIN_SECONDS = 30.0
+
+def _palette_segments(start: float, end: float) -> Optional[list[Tuple[float, float]]]:
+    """Return equal (start, length) windows for parallel palettegen, or None."""
+    cpus = os.cpu_count() or 1
+    n = min(4, cpus // 2)
+    if end - start <= PARALLEL_PALETTE_MIN_SECONDS or cpus <= 2 or n < 2:
+        return None
+    length = (end - start) / n
+    return [(start + i * length, length) for i in range(n)]
+
+# The one-pass split graph buffers every frame until palettegen reaches EOF;
+# above this estimated size the palette is written to disk first instead
+SPLIT_PALETTE_MAX_BYTES = 256 * 1024 * 1024
+
+def _split_buffer_bytes(input_path: str, start: float, end: float, fps: int,
+                        width: Optional[int]) -> Optional[int]:
+    """Estimate the RGBA frames split would hold for this export; None if the size is unknown."""
+    info = probe_video(input_path)
+    if not info.width or not info.height:
+        return None
+    out_w = width or info.width
+    out_h = max(1, round(info.height * out_w / info.width))
+    return int((end - start) * fps * out_w * out_h * 4)
+
+def _generate_palette_parallel(input_path: str, segments: list[Tuple[float, float]], filters: str,
+                               max_colors: int, stats_mode: str, palette_path: str, work_dir: str,
+                               progress_callback=None, proc_callback=None) -> Tuple[bool, str]:
     """
-    Run palette-based two-pass ffmpeg GIF generation.
-    Returns (success, message).
+    Run one palettegen per segment concurrently, then merge the per-segment
+    palettes into palette_path with a single palettegen over their hstack.
     """
-    palette_path = os.path.join(work_dir, "palette.png")
-    ss = format_time_seconds(start)
-    to = format_time_seconds(end)
-    scale = f"scale={width}:-1:flags=lanczos" if width else "scale=iw:-1:flags=lanczos"
-    # Palette generation
-    palette_cmd = [
-        "ffmpeg", "-ss", ss, "-to", to, "-i", input_path,
-        "-vf", f"fps={fps},{scale},palettegen",
-        "-y", palette_path
+    seg_paths = [os.path.join(work_dir, f"palette_{i}.png") for i in range(len(segments))]
+    cmds = [
+        # input-side -t so each worker stops decoding at the end of its window
+        [FFMPEG_CMD, "-ss", f"{seg_start:.6f}", "-t", f"{seg_len:.6f}", "-i", input_path,
+         "-vf", f"{filters},palettegen=max_colors={max_colors}:stats_mode={stats_mode}", "-y", seg_path]
+        for (seg_start, seg_len), seg_path in zip(segments, seg_paths)
     ]
+    if len(segments) == 1:
+        # a single window writes the final palette directly, no merge needed
+        seg_paths = [palette_path]
+        cmds[0][-1] = palette_path
     if progress_callback:
-        progress_callback(f"Running palette generation:\n{' '.join(shlex.quote(x) for x in palette_cmd)}")
-    rc, out, err = run_subprocess(palette_cmd)
+        progress_callback(f"Generating palette in {len(segments)} segment(s)...")
+    # ffmpeg does the work, so threads are enough to keep the segments concurrent
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(cmds)) as pool:
+        results = list(pool.map(lambda c: stream_ffmpeg(c, None, proc_callback=proc_callback), cmds))
+    for rc, err in results:
+        if rc != 0:
+            return False, err
+    if len(segments) == 1:
+        return True, "Palette generated."
+    merge_cmd = [FFMPEG_CMD, "-nostdin", "-loglevel", "error"]
+    for seg_path in seg_paths:
+        merge_cmd += ["-i", seg_path]
+    merge_cmd += ["-filter_complex",
+                  f"hstack=inputs={len(seg_paths)},palettegen=max_colors={max_colors}:stats_mode=single",
+                  "-y", palette_path]
+    rc, out, err = run_captured(merge_cmd)
     if rc != 0:
-        return False, f"Palette generation failed: {err or out}"
-    # Use palette to create gif
-    gif_cmd = [
-        "ffmpeg", "-ss", ss, "-to", to, "-i", input_path, "-i", palette_path,
-        "-lavfi", f"fps={fps},{scale} [x]; [x][1:v] paletteuse",
-        "-y", output_path
-    ]
+        return False, err or out
+    return True, "Palette generated."
+
+def run_ffmpeg_palette(input_path: str, start: float, end: float, fps: int, width: Optional[int], output_path: str,
+                       work_dir: Optional[str] = None, progress_callback=None, max_colors: int = 256,
+                       stats_mode: str = "full", dither: str = "sierra2_4a",
+                       proc_callback=None) -> Tuple[bool, str]:
+    """
+    Run palette-based GIF generation.
+
+    Short exports run a single ffmpeg pass: the scaled stream is split so
+    palettegen and paletteuse share one decode of the input. split holds every
+    frame until the palette is ready, so when the estimated buffer exceeds
+    SPLIT_PALETTE_MAX_BYTES (or the output size is unknown) the palette is
+    generated first and then applied in a separate paletteuse pass. Long clips
+    on multi-core machines generate that palette from parallel segments (each
+    worker decodes a slice of the range).
+    Only the two-pass path writes palette files: into work_dir if given,
+    otherwise into a temporary directory that is removed afterwards.
+    max_colors/stats_mode are passed to palettegen and dither to paletteuse.
+    proc_callback receives every ffmpeg Popen started (see stream_ffmpeg).
+    Returns (success, message).
+    """
+    ss = f"{start:.6f}"
+    t = f"{end - start:.6f}"
+    scale = _scale_filter(width)
+    filters = f"fps={fps},{scale}"
+    palettegen = f"palettegen=max_colors={max_colors}:stats_mode={stats_mode}"
+    paletteuse = f"paletteuse=dither={dither}"
+    segments = _palette_segments(start, end)
+    if not segments:
+        buffered = _split_buffer_bytes(input_path, start, end, fps, width)
+        if buffered is None or buffered > SPLIT_PALETTE_MAX_BYTES:
+            segments = [(start, end - start)]
+    if not segments:
+        # -t must be an input option here: palettegen only emits at input EOF, so an
+        # output -t would decode (and buffer in split) everything up to end of file
+        cmd = [
+            FFMPEG_CMD, "-ss", ss, "-t", t, "-i", input_path,
+            "-filter_complex", f"{filters},split[a][b];[a]{palettegen}[p];[b][p]{paletteuse}",
+            *GIF_OUTPUT_ARGS, "-y", output_path
+        ]
+        return _run_palette_command(cmd, end - start, progress_callback, proc_callback)
+    own_dir = work_dir is None
+    if own_dir:
+        work_dir = tempfile.mkdtemp(prefix="v2g_work_")
+    try:
+        palette_path = os.path.join(work_dir, "palette.png")
+        ok, msg = _generate_palette_parallel(input_path, segments, filters, max_colors, stats_mode,
+                                             palette_path, work_dir, progress_callback, proc_callback)
+        if not ok:
+            return False, f"Palette generation failed: {msg}"
+        cmd = [
+            FFMPEG_CMD, "-ss", ss, "-i", input_path, "-i", palette_path, "-t", t,
+            "-filter_complex", f"[0:v]{filters}[x];[x][1:v]{paletteuse}",
+            *GIF_OUTPUT_ARGS, "-y", output_path
+        ]
+        return _run_palette_command(cmd, end - start, progress_callback, proc_callback)
+    finally:
+        if own_dir:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+def _run_palette_command(cmd: list[str], duration: float, progress_callback, proc_callback) -> Tuple[bool, str]:
     if progress_callback:
-        progress_callback(f"Running palette use:\n{' '.join(shlex.quote(x) for x in gif_cmd)}")
-    rc2, out2, err2 = run_subprocess(gif_cmd)
-    if rc2 != 0:
-        return False, f"Palette-based gif creation failed: {err2 or out2}"
+        progress_callback(f"Running palette command:\n{' '.join(shlex.quote(x) for x in cmd)}")
+    rc, err = stream_ffmpeg(cmd, duration, _progress_logger(progress_callback), proc_callback=proc_callback)
+    if rc != 0:
+        return False, f"Palette-based gif creation failed: {err}"
     return True, "GIF created successfully (palette method)."
 
 def run_ffmpeg_single(input_path: str, start: float, end: float, fps: int, width: Optional[int], output_path: str,
-                      progress_callback=None) -> Tuple[bool, str]:
+                      progress_callback=None, proc_callback=None) -> Tuple[bool, str]:
     """Run single-step ffmpeg command to create gif (faster, lower quality)."""
-    ss = format_time_seconds(start)
-    to = format_time_seconds(end)
-    scale = f"scale={width}:-1:flags=lanczos" if width else "scale=iw:-1:flags=lanczos"
+    ss = f"{start:.6f}"
+    t = f"{end - start:.6f}"
+    scale = _scale_filter(width)
     cmd = [
-        "ffmpeg", "-ss", ss, "-to", to, "-i", input_path,
+        FFMPEG_CMD, "-ss", ss, "-i", input_path, "-t", t,
         "-vf", f"fps={fps},{scale}",
-        "-y", output_path
+        *GIF_OUTPUT_ARGS, "-y", output_path
     ]
     if progress_callback:
         progress_callback(f"Running single-step command:\n{' '.join(shlex.quote(x) for x in cmd)}")
-    rc, out, err = run_subprocess(cmd)
+    rc, err = stream_ffmpeg(cmd, end - start, _progress_logger(progress_callback), proc_callback=proc_callback)
     if rc != 0:
-        return False, f"Single-step GIF creation failed: {err or out}"
+        return False, f"Single-step GIF creation failed: {err}"
     return True, "GIF created successfully (single-step method)."
 
 # Preview frame
 
-def extract_frame_to_file(input_path: str, time_sec: float, out_path: str) -> Tuple[bool, str]:
-    """Extract a single frame at time_sec (seconds) to out_path using ffmpeg."""
-    ss = format_time_seconds(time_sec)
-    cmd = [
-        "ffmpeg", "-ss", ss, "-i", input_path,
-        "-frames:v", "1",
-        "-q:v", "2",
-        "-y",
-        out_path
-    ]
-    rc, out, err = run_subprocess(cmd)
-    if rc != 0:
-        return False, err or out
-    return True, "Frame extracted."
+def _fit_scale_filter(fit: Tuple[int, int]) -> str:
+    """Scale filter that shrinks a frame to fit inside fit=(w, h) but never enlarges it."""
+    w, h = fit
+    return f"scale='min(iw,{w})':'min(ih,{h})':force_original_aspect_ratio=decrease:flags=lanczos"
+
+def extract_frame_bytes(input_path: str, time_sec: float,
+                        fit: Optional[Tuple[int, int]] = None) -> Tuple[Optional[bytes], str]:
+    """
+    Extract a single frame at time_sec (seconds) as BMP bytes piped over
+    ffmpeg's stdout (no temporary file, no JPEG round-trip).
+    If fit=(w, h) is given, ffmpeg downscales the frame to fit inside that box
+    (aspect preserved, smaller frames are left as is) before it is piped.
+    Returns (data, message); data is None on failure.
+    """
+    ss = f"{time_sec:.6f}"
+    cmd = [FFMPEG_CMD, "-ss", ss, "-i", input_path, "-frames:v", "1"]
+    if fit:
+        cmd += ["-vf", _fit_scale_filter(fit)]
+    cmd += ["-f", "image2pipe", "-vcodec", "bmp", "-"]
+    try:
+        proc = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=False)
+    except Exception as e:
+        return None, str(e)
+    if proc.returncode != 0 or not proc.stdout:
+        return None, proc.stderr.decode(errors="replace") or "ffmpeg produced no frame."
+    return proc.stdout, "Frame extracted."
+
+def _split_bmp_stream(data: bytes) -> list[bytes]:
+    """Split concatenated BMP images using the size in each file header."""
+    frames = []
+    pos = 0
+    while pos + 14 <= len(data) and data[pos:pos + 2] == b"BM":
+        size = int.from_bytes(data[pos + 2:pos + 6], "little")
+        if size < 14 or pos + size > len(data):
+            break
+        frames.append(data[pos:pos + size])
+        pos += size
+    return frames
+
+def extract_frames_batch(input_path: str, timestamps: list[float],
+                         fit: Optional[Tuple[int, int]] = None) -> dict[float, bytes]:
+    """
+    Extract frames for several timestamps with one ffmpeg run.
+
+    The file is opened once per timestamp with its own input -ss, so every
+    position gets a fast keyframe seek and the same frame extract_frame_bytes
+    would return (the first at or after the timestamp). The first frame of
+    each input is concatenated into one stream and piped as BMP.
+    Returns {timestamp: data} for the frames that were produced.
+    """
+    stamps = sorted(set(timestamps))
+    if not stamps:
+        return {}
+    cmd = [FFMPEG_CMD, "-nostdin", "-loglevel", "error"]
+    for ts in stamps:
+        cmd += ["-ss", f"{ts:.6f}", "-i", input_path]
+    scale = "," + _fit_scale_filter(fit) if fit else ""
+    graph = ";".join(f"[{i}:v]trim=end_frame=1{scale}[v{i}]" for i in range(len(stamps)))
+    graph += ";" + "".join(f"[v{i}]" for i in range(len(stamps))) + f"concat=n={len(stamps)}:v=1:a=0[out]"
+    cmd += ["-filter_complex", graph, "-map", "[out]", "-fps_mode", "vfr",
+            "-frames:v", str(len(stamps)), "-f", "image2pipe", "-vcodec", "bmp", "-"]
+    try:
+        proc = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, check=False)
+    except Exception:
+        return {}
+    frames = _split_bmp_stream(proc.stdout)
+    if len(frames) != len(stamps):
+        # a position past the end (or a failure) would shift the mapping; use none
+        return {}
+    return dict(zip(stamps, frames))
+
+class PreviewWorker:
+    """
+    Keep one ffmpeg process alive between previews of the same file.
+
+    The process is started at the requested time with a constant output rate
+    (the source frame rate) and pipes BMP frames on demand, so a later preview
+    a little further into the clip is served by reading forward from the same
+    decoder instead of spawning ffmpeg again. Seeking backwards, jumping more
+    than MAX_FORWARD seconds ahead or changing file restarts the process.
+    """
+    MAX_FORWARD = 5.0  # seconds; beyond this a fresh input seek is cheaper
+
+    def __init__(self):
+        self._proc: Optional[subprocess.Popen] = None
+        self._key: Optional[tuple] = None  # (path, fit) the process was started for
+        self._rate = 25.0
+        self._pos = 0.0  # timestamp of the next frame the process will emit
+
+    def frame_at(self, input_path: str, time_sec: float,
+                 fit: Optional[Tuple[int, int]] = None) -> Tuple[Optional[bytes], str]:
+        """
+        Return (data, message) like extract_frame_bytes: the first frame at or
+        after time_sec, as an input seek (and the export) would start on.
+        """
+        key = (input_path, fit)
+        # the frame before _pos was already consumed; if it could be the answer, re-seek
+        consumed = self._pos - 1.0 / self._rate
+        if (self._proc is None or self._key != key or time_sec <= consumed + 1e-6
+                or time_sec - self._pos > self.MAX_FORWARD):
+            self._start(input_path, time_sec, fit)
+        skip = max(0, math.ceil((time_sec - self._pos) * self._rate - 1e-6))
+        data = None
+        for _ in range(skip + 1):
+            data = self._read_frame()
+            if data is None:
+                break
+        if data is None:
+            # stream ended or ffmpeg failed; report through the one-shot path
+            self.close()
+            data, msg = extract_frame_bytes(input_path, time_sec, fit)
+        else:
+            self._pos += (skip + 1) / self._rate
+            msg = "Frame extracted."
+        return data, msg
+
+    def _start(self, input_path: str, time_sec: float, fit: Optional[Tuple[int, int]]):
+        self.close()
+        self._rate = probe_video(input_path).fps or 25.0
+        vf = f"fps={self._rate:.6f}"
+        # swscale builds its Lanczos filter bank once per process; every frame
+        # read from this process reuses it, so no Python-side resample is needed
+        if fit:
+            vf += "," + _fit_scale_filter(fit)
+        cmd = [FFMPEG_CMD, "-nostdin", "-loglevel", "error", "-ss", f"{time_sec:.6f}", "-i", input_path,
+               "-vf", vf, "-f", "image2pipe", "-vcodec", "bmp", "-"]
+        try:
+            self._proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        except Exception:
+            self._proc = None
+        self._key = (input_path, fit)
+        self._pos = time_sec
+
+    def _read_frame(self) -> Optional[bytes]:
+        """Read one BMP image (size taken from its file header) from the pipe."""
+        if self._proc is None:
+            return None
+        header = self._proc.stdout.read(14)
+        if len(header) < 14 or header[:2] != b"BM":
+            return None
+        size = int.from_bytes(header[2:6], "little")
+        body = self._proc.stdout.read(size - 14)
+        if len(body) < size - 14:
+            return None
+        return header + body
+
+    def close(self):
+        """Stop the ffmpeg process, if any."""
+        proc, self._proc = self._proc, None
+        self._key = None
+        if proc is not None:
+            try:
+                proc.kill()
+                proc.stdout.close()
+                proc.wait()
+            except Exception:
+                pass
 
 # GUI
 
+def _file_stamp(path: str) -> Optional[Tuple[int, int]]:
+    """Return (st_mtime_ns, st_size) of path, or None if it does not exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+PREVIEW_CACHE_SIZE = 16  # thumbnails kept by on_preview (~0.2 MB each)
+SCRUB_POSITIONS = 10  # the scrub slider snaps to this many evenly spaced start times
+
 class VideoToGifGUI:
     def __init__(self, root: tk.Tk):
         self.root = root
@@ -335,12 +796,27 @@ class VideoToGifGUI:
         self.input_path: Optional[str] = None
         self.duration: Optional[float] = None
         self.preview_image = None  # keep ref to avoid GC
+        self.preview_worker = PreviewWorker()
+        # (input_path, file stamp, start rounded to ms) -> PhotoImage, least recently used first;
+        # the stamp (mtime, size) keeps thumbnails of an overwritten file from being reused
+        self._preview_cache: OrderedDict[tuple, "ImageTk.PhotoImage"] = OrderedDict()
+        self._scrub_index: Optional[int] = None
+        self._scrub_filled_for: Optional[str] = None  # input_path whose scrub frames were batch-extracted
         self.temp_dir_obj = None
         self._build_ui()
         self.ffmpeg_ok = check_ffmpeg_available()
         if not self.ffmpeg_ok:
-            messagebox.showerror("ffmpeg not found", "ffmpeg or ffprobe not found on PATH. Please install ffmpeg and ensure ffmpeg and ffprobe are available.")
+            messagebox.showerror("ffmpeg not found", "ffmpeg not found on PATH. Please install ffmpeg and ensure it is available.")
         self._lock = threading.Lock()
+        # ffmpeg processes of the running export, so Cancel can stop them
+        self._procs_lock = threading.Lock()
+        self._current_procs: list[subprocess.Popen] = []
+        self._cancel_requested = False
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+
+    def _on_close(self):
+        self.preview_worker.close()
+        self.root.destroy()
 
     def _build_ui(self):
         frm = ttk.Frame(self.root, padding=10)
@@ -392,6 +868,8 @@ class VideoToGifGUI:
         self.method_var = tk.StringVar(value="palette")
         ttk.Radiobutton(method_row, text="Palette (best)", variable=self.method_var, value="palette").grid(row=0, column=1, sticky="w", padx=(6,6))
         ttk.Radiobutton(method_row, text="Single-step (faster)", variable=self.method_var, value="single").grid(row=0, column=2, sticky="w", padx=(6,6))
+        self.fast_palette_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(method_row, text="Fast palette (128 colors, bayer)", variable=self.fast_palette_var).grid(row=0, column=3, sticky="w", padx=(6,6))
 
         # Preview and export buttons
         btn_row = ttk.Frame(frm)
@@ -399,6 +877,8 @@ class VideoToGifGUI:
         ttk.Button(btn_row, text="Preview Frame", command=self.on_preview).grid(row=0, column=0, sticky="w")
         ttk.Button(btn_row, text="Export GIF", command=self.on_export).grid(row=0, column=1, sticky="w", padx=(6,6))
         ttk.Button(btn_row, text="Choose Output...", command=self.choose_output).grid(row=0, column=2, sticky="w", padx=(6,6))
+        self.cancel_button = ttk.Button(btn_row, text="Cancel", command=self.cancel_export, state="disabled")
+        self.cancel_button.grid(row=0, column=3, sticky="w", padx=(6,6))
 
         # Output path
         out_row = ttk.Frame(frm)
@@ -413,6 +893,9 @@ class VideoToGifGUI:
         self.canvas = tk.Canvas(preview_row, width=320, height=180, bg="#222")
         self.canvas.grid(row=0, column=0, sticky="w")
         self.canvas_text = self.canvas.create_text(160, 90, text="Preview\n(install Pillow for thumbnails)", fill="white", justify="center")
+        self.scrub_scale = ttk.Scale(preview_row, from_=0, to=1, orient="horizontal", length=320,
+                                     command=self.on_scrub, state="disabled")
+        self.scrub_scale.grid(row=1, column=0, sticky="w", pady=(4, 0))
 
         # Status/log
         log_row = ttk.Frame(frm)
@@ -460,9 +943,13 @@ class VideoToGifGUI:
             # If end not set, default to duration
             if not self.end_var.get().strip():
                 self.end_var.set(f"{self.duration:.3f}")
+            self.scrub_scale.configure(to=self.duration, state="normal")
         else:
             self.duration_label.configure(text="Unknown")
             self.log("Duration: unknown")
+            self.scrub_scale.configure(state="disabled")
+        self._scrub_index = None
+        self._scrub_filled_for = None
 
     def choose_output(self):
         initial = ""
@@ -485,33 +972,100 @@ class VideoToGifGUI:
         if t is None:
             messagebox.showwarning("Invalid start", "Start time is invalid.")
             return
-        # Extract frame to a temp file
-        td = tempfile.TemporaryDirectory(prefix="v2g_preview_")
-        frame_path = os.path.join(td.name, "preview.jpg")
+        canvas_w = int(self.canvas.cget("width"))
+        canvas_h = int(self.canvas.cget("height"))
+        key = (self.input_path, _file_stamp(self.input_path), round(t, 3))
+        cached = self._preview_cache.get(key)
+        if cached is not None:
+            # fps/width/method do not affect the preview frame, so no ffmpeg needed
+            self._preview_cache.move_to_end(key)
+            self._show_preview(cached)
+            self.log("Preview displayed (cached).")
+            return
         self.log(f"Extracting frame at {t} s ...")
-        ok, msg = extract_frame_to_file(self.input_path, t, frame_path)
-        if not ok:
+        # ffmpeg scales the frame to fit the canvas, so only a thumbnail crosses the pipe
+        data, msg = self.preview_worker.frame_at(self.input_path, t, fit=(canvas_w, canvas_h))
+        if data is None:
             self.log(f"Preview failed: {msg}")
-            td.cleanup()
             return
         try:
-            img = Image.open(frame_path)
-            # Resize to fit canvas
-            canvas_w = int(self.canvas.cget("width"))
-            canvas_h = int(self.canvas.cget("height"))
-            img.thumbnail((canvas_w, canvas_h), Image.LANCZOS)
-            self.preview_image = ImageTk.PhotoImage(img)
-            self.canvas.delete("all")
-            self.canvas.create_image(canvas_w//2, canvas_h//2, image=self.preview_image)
-            self.log("Preview displayed.")
+            photo = self._photo_from_bytes(data)
         except Exception as e:
             self.log(f"Preview error: {e}")
-        finally:
-            td.cleanup()
+            return
+        self._cache_preview(key, photo)
+        self._show_preview(photo)
+        self.log("Preview displayed.")
+
+    def on_scrub(self, value):
+        if not PIL_AVAILABLE or not self.input_path or not self.duration:
+            return
+        step = self.duration / SCRUB_POSITIONS
+        index = min(SCRUB_POSITIONS - 1, int(float(value) / step))
+        if index == self._scrub_index:
+            return
+        self._scrub_index = index
+        if self._scrub_filled_for != self.input_path:
+            self._scrub_filled_for = self.input_path
+            self._fill_scrub_cache(step)
+        self.start_var.set(f"{index * step:.3f}")
+        self.on_preview()
+
+    def _fill_scrub_cache(self, step: float):
+        """
+        Extract every scrub position with a single ffmpeg run in a background
+        thread; the frames are added to _preview_cache on the UI thread.
+        """
+        timestamps = [round(i * step, 3) for i in range(SCRUB_POSITIONS)]
+        canvas_w = int(self.canvas.cget("width"))
+        canvas_h = int(self.canvas.cget("height"))
+        self.log(f"Extracting {len(timestamps)} scrub frames ...")
+        thread = threading.Thread(target=self._scrub_batch_worker,
+                                  args=(self.input_path, timestamps, (canvas_w, canvas_h)))
+        thread.daemon = True
+        thread.start()
+
+    def _scrub_batch_worker(self, input_path: str, timestamps: list[float], fit: Tuple[int, int]):
+        stamp = _file_stamp(input_path)
+        frames = extract_frames_batch(input_path, timestamps, fit=fit)
+        try:
+            self.root.after(0, lambda: self._store_scrub_frames(input_path, stamp, frames))
+        except Exception:
+            pass
+
+    def _store_scrub_frames(self, input_path: str, stamp: Optional[Tuple[int, int]],
+                            frames: dict[float, bytes]):
+        for ts, data in frames.items():
+            key = (input_path, stamp, ts)
+            if key in self._preview_cache:
+                continue
+            try:
+                self._cache_preview(key, self._photo_from_bytes(data))
+            except Exception:
+                pass
+
+    def _photo_from_bytes(self, data: bytes):
+        # frames arrive already fitted to the canvas by ffmpeg (see extract_frame_bytes)
+        img = Image.open(io.BytesIO(data))
+        img.load()
+        return ImageTk.PhotoImage(img)
+
+    def _cache_preview(self, key: tuple, photo):
+        self._preview_cache[key] = photo
+        self._preview_cache.move_to_end(key)
+        if len(self._preview_cache) > PREVIEW_CACHE_SIZE:
+            self._preview_cache.popitem(last=False)
+
+    def _show_preview(self, photo):
+        canvas_w = int(self.canvas.cget("width"))
+        canvas_h = int(self.canvas.cget("height"))
+        self.preview_image = photo
+        self.canvas.delete("all")
+        self.canvas.create_image(canvas_w//2, canvas_h//2, image=self.preview_image)
 
     def on_export(self):
         if not self.ffmpeg_ok:
-            messagebox.showerror("ffmpeg missing", "ffmpeg or ffprobe not found. Install ffmpeg and try again.")
+            messagebox.showerror("ffmpeg missing", "ffmpeg not found. Install ffmpeg and try again.")
             return
         if not self.input_path:
             messagebox.showwarning("No file", "Please choose a video file first.")
@@ -560,28 +1114,48 @@ class VideoToGifGUI:
             out_path = path
             self.output_var.set(out_path)
         # Prepare options
-        options = ExportOptions(fps=fps, width=width, method=self.method_var.get())
-        # Create temporary working dir
-        workdir = tempfile.mkdtemp(prefix="v2g_work_")
-        self.log(f"Working directory: {workdir}")
+        method = self.method_var.get()
+        # the preset only tunes palettegen/paletteuse, so single-step ignores it
+        palette_opts = FAST_PALETTE if method == "palette" and self.fast_palette_var.get() else {}
+        options = ExportOptions(fps=fps, width=width, method=method, **palette_opts)
         # Run ffmpeg in a separate thread
-        thread = threading.Thread(target=self._export_worker, args=(self.input_path, start, end, options, out_path, workdir))
+        thread = threading.Thread(target=self._export_worker, args=(self.input_path, start, end, options, out_path))
         thread.daemon = True
         thread.start()
 
-    def _export_worker(self, input_path: str, start: float, end: float, opts: ExportOptions, out_path: str, workdir: str):
+    def _export_worker(self, input_path: str, start: float, end: float, opts: ExportOptions, out_path: str):
         # guard to ensure only one export at a time
         if not self._lock.acquire(blocking=False):
             self.log("Another export is in progress. Please wait.")
             return
+        with self._procs_lock:
+            self._cancel_requested = False
+            self._current_procs = []
+        # remember any existing output so a cancel only removes what this export wrote
+        out_stamp = _file_stamp(out_path)
         try:
-            self.log(f"Starting export: {input_path} [{start} -> {end}] fps={opts.fps} width={opts.width} method={opts.method}")
+            details = f"fps={opts.fps} width={opts.width} method={opts.method}"
+            if opts.method == "palette":
+                details += f" colors={opts.max_colors} dither={opts.dither}"
+            self.log(f"Starting export: {input_path} [{start} -> {end}] {details}")
             self._set_ui_busy(True)
             if opts.method == "palette":
-                ok, msg = run_ffmpeg_palette(input_path, start, end, opts.fps, opts.width, out_path, workdir, progress_callback=self._thread_safe_log)
+                ok, msg = run_ffmpeg_palette(input_path, start, end, opts.fps, opts.width, out_path,
+                                             progress_callback=self._thread_safe_log, max_colors=opts.max_colors,
+                                             stats_mode=opts.stats_mode, dither=opts.dither,
+                                             proc_callback=self._register_proc)
             else:
-                ok, msg = run_ffmpeg_single(input_path, start, end, opts.fps, opts.width, out_path, progress_callback=self._thread_safe_log)
-            if ok:
+                ok, msg = run_ffmpeg_single(input_path, start, end, opts.fps, opts.width, out_path,
+                                            progress_callback=self._thread_safe_log, proc_callback=self._register_proc)
+            if self._cancel_requested:
+                self._thread_safe_log("Export cancelled.")
+                new_stamp = _file_stamp(out_path)
+                if new_stamp is not None and new_stamp != out_stamp:
+                    try:
+                        os.remove(out_path)  # partial GIF written by this export
+                    except OSError:
+                        pass
+            elif ok:
                 self._thread_safe_log(f"Success: {msg}")
                 self._thread_safe_log(f"Output saved to: {out_path}")
                 messagebox.showinfo("Export complete", f"GIF exported to:\n{out_path}")
@@ -589,22 +1163,42 @@ class VideoToGifGUI:
                 self._thread_safe_log(f"Failed: {msg}")
                 messagebox.showerror("Export failed", f"{msg}")
         finally:
-            # cleanup workdir
+            with self._procs_lock:
+                self._current_procs = []
+            self._set_ui_busy(False)
+            self._lock.release()
+
+    def _register_proc(self, proc: subprocess.Popen):
+        """Track an export ffmpeg process; stop it at once if Cancel was already pressed."""
+        with self._procs_lock:
+            self._current_procs.append(proc)
+            if self._cancel_requested:
+                proc.kill()
+
+    def cancel_export(self):
+        """Kill the ffmpeg process(es) of the running export."""
+        with self._procs_lock:
+            if not self._lock.locked():
+                return
+            self._cancel_requested = True
+            procs = list(self._current_procs)
+        self.log("Cancelling export...")
+        for proc in procs:
             try:
-                import shutil
-                shutil.rmtree(workdir, ignore_errors=True)
-                self._thread_safe_log("Cleaned temporary files.")
+                # not SIGTERM: ffmpeg treats it as a graceful stop and keeps
+                # encoding buffered frames; the partial output is discarded anyway
+                proc.kill()
             except Exception:
                 pass
-            self._set_ui_busy(False)
-            self._lock.release()
 
     def _set_ui_busy(self, busy: bool):
         def _set():
             if busy:
                 self.root.config(cursor="watch")
+                self.cancel_button.configure(state="normal")
             else:
                 self.root.config(cursor="")
+                self.cancel_button.configure(state="disabled")
         try:
             self.root.after(0, _set)
         except Exception: